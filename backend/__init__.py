@@ -23,12 +23,23 @@ Usage:
     This module is imported automatically when initializing the backend layer.
 """
 
-# Explicitly import important high-level components for easier access
-from backend.utils import config, logger
-from backend.agents.swagger_agent import SwaggerToPostmanAgent
+from importlib import import_module
 
 __all__ = [
     "config",
     "logger",
     "SwaggerToPostmanAgent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # Resolved on first access so `import backend.utils.constants` stays lightweight
+    if name in ("config", "logger"):
+        module = import_module(f"backend.utils.{name}")
+        globals()[name] = module
+        return module
+    # The agent pulls in torch / sentence-transformers; import it only on first access
+    if name == "SwaggerToPostmanAgent":
+        from backend.agents.swagger_agent import SwaggerToPostmanAgent
+        return SwaggerToPostmanAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
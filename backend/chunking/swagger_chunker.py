@@ -30,8 +30,10 @@ import os
 import json
 import yaml
 import hashlib
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from uuid import uuid4
 
 from backend.utils.logger import logger
@@ -41,9 +43,51 @@ from backend.utils.constants import (
     METADATA_FIELD_ORIGIN,
     METADATA_FIELD_FILENAME,
     METADATA_FIELD_HASH,
+    SPEC_CACHE_DIR,
 )
+from backend.utils.file_loader import load_swagger_file
 from backend.utils.swagger_converter import SwaggerFormatNormalizer
 
+_HTTP_METHODS = frozenset(("get", "post", "put", "delete", "patch", "head", "options", "trace"))
+
+
+def _load_swagger_cached(path: Path) -> Dict[str, Any]:
+    """
+    Loads a Swagger spec, reusing a pickled copy while the file's mtime and
+    size are unchanged. Each resolved path has a single cache file, which is
+    overwritten whenever the spec changes.
+
+    Args:
+        path (Path): Swagger file (YAML or JSON).
+
+    Returns:
+        Dict[str, Any]: Parsed OpenAPI specification.
+    """
+    resolved = path.resolve()
+    stat = resolved.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cache_file = SPEC_CACHE_DIR / f"{hashlib.sha256(str(resolved).encode('utf-8')).digest()[:8].hex()}.pkl"
+
+    if cache_file.exists():
+        try:
+            with cache_file.open("rb") as f:
+                cached_fingerprint, swagger = pickle.load(f)
+            if cached_fingerprint == fingerprint:
+                logger.debug(f"📦 Using cached parsed spec for: {path}")
+                return swagger
+        except Exception as e:
+            # Truncated, stale-format or otherwise unreadable pickles are just re-parsed
+            logger.warning(f"⚠️ Discarding unreadable spec cache {cache_file.name}: {e}")
+
+    swagger = load_swagger_file(str(resolved))
+
+    SPEC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Per-writer temp file, so concurrent loaders of one spec never share an inode
+    with tempfile.NamedTemporaryFile(dir=SPEC_CACHE_DIR, suffix=".tmp", delete=False) as f:
+        pickle.dump((fingerprint, swagger), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, cache_file)
+    return swagger
+
 
 class SwaggerChunker:
     """
@@ -63,10 +107,30 @@ class SwaggerChunker:
         self.security_schemes = swagger.get("components", {}).get("securitySchemes", {})
         self.global_security = swagger.get("security", [])
         self.chunks: List[Dict[str, Any]] = []
+        self._swagger_base_meta = self._base_metadata(ChunkType.SWAGGER)
+        # Memoized $ref targets, pre-seeded so component schema refs are a single lookup
+        self._ref_cache: Dict[str, Any] = {
+            f"#/components/schemas/{name}": schema for name, schema in (self.components or {}).items()
+        }
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> "SwaggerChunker":
+        """
+        Builds a chunker straight from a Swagger file on disk.
+        Parsed specs are cached, so re-running on an unmodified file skips parsing.
+
+        Args:
+            file_path (str | Path): Path to the Swagger file (YAML or JSON).
+
+        Returns:
+            SwaggerChunker: Chunker over the loaded spec.
+        """
+        path = Path(file_path)
+        return cls(_load_swagger_cached(path), str(path))
 
     def _resolve_ref(self, ref: str) -> Dict[str, Any]:
         """
-        Resolves a $ref string to the actual schema dictionary.
+        Resolves a $ref string to the actual schema dictionary, memoizing the result.
 
         Args:
             ref (str): A $ref path (e.g., "#/components/schemas/User")
@@ -74,6 +138,21 @@ class SwaggerChunker:
         Returns:
             Dict[str, Any]: The referenced schema object.
         """
+        resolved = self._ref_cache.get(ref)
+        if resolved is None:
+            resolved = self._ref_cache[ref] = self._walk_ref(ref)
+        return resolved
+
+    def _walk_ref(self, ref: str) -> Dict[str, Any]:
+        """
+        Walks the Swagger document along a $ref path.
+
+        Args:
+            ref (str): A $ref path (e.g., "#/components/parameters/PageSize")
+
+        Returns:
+            Dict[str, Any]: The referenced object.
+        """
         ref_path = ref.lstrip("#/").split("/")
         result = self.swagger
         for part in ref_path:
@@ -92,7 +171,7 @@ class SwaggerChunker:
         Returns:
             str: Hashed UUID-style identifier.
         """
-        return hashlib.sha256(base.encode("utf-8")).hexdigest()[:16]
+        return hashlib.sha256(base.encode("utf-8")).digest()[:8].hex()
 
     def _base_metadata(self, chunk_type: ChunkType) -> Dict[str, Any]:
         """
@@ -110,19 +189,18 @@ class SwaggerChunker:
             METADATA_FIELD_FILENAME: self.source_file
         }
 
-    def _extract_endpoints(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+    def _extract_endpoints(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
         """
-        Extracts (method, path, operation_obj) for all valid operations.
+        Yields (method, path, operation_obj) for all valid operations.
 
-        Returns:
-            List[Tuple[str, str, Dict]]: Each item is (method, path, operation).
+        Yields:
+            Tuple[str, str, Dict]: Each item is (method, path, operation).
         """
-        all_ops = []
         for path, methods in self.swagger.get("paths", {}).items():
             for method, op in methods.items():
-                if method.lower() in ["get", "post", "put", "delete", "patch"]:
-                    all_ops.append((method.lower(), path, op))
-        return all_ops
+                m = method.lower()
+                if m in _HTTP_METHODS:
+                    yield m, path, op
 
     def extract_chunks(self) -> List[Dict[str, Any]]:
         """
@@ -133,34 +211,54 @@ class SwaggerChunker:
             List[Dict]: Finalized chunks ready for embedding.
         """
         for method, path, operation in self._extract_endpoints():
-            operation_id = operation.get("operationId", f"{method}_{path.replace('/', '_')}")
-            summary = operation.get("summary", "")
-            parameters = self._extract_parameters(operation)
-            request_body = self._extract_request_body(operation)
-            responses = self._extract_responses(operation)
-            security = self._extract_security(operation)
-
-            base_text = f"{method.upper()} {path}\n\n{summary}\n\nParameters:\n{parameters}\n\n"
-            if request_body:
-                base_text += f"Request Body:\n{request_body}\n\n"
-            base_text += f"Responses:\n{responses}\n\nSecurity: {security}"
-
-            chunk = {
-                "id": self._generate_chunk_id(base_text),
-                "type": ChunkType.SWAGGER,
-                "text": base_text.strip(),
-                "metadata": {
-                    **self._base_metadata(ChunkType.SWAGGER),
-                    "method": method,
-                    "path": path,
-                    "operation_id": operation_id
-                }
-            }
-
-            self.chunks.append(chunk)
+            self.chunks.append(self._build_chunk_for_op(method, path, operation))
 
         return self.chunks
 
+    def _build_chunk_for_op(self, method: str, path: str, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the chunk for a single operation.
+
+        Args:
+            method (str): HTTP method (lowercase).
+            path (str): Endpoint path.
+            operation (Dict): The OpenAPI operation object.
+
+        Returns:
+            Dict[str, Any]: The finalized chunk.
+        """
+        operation_id = operation.get("operationId", f"{method}_{path.replace('/', '_')}")
+        summary = operation.get("summary", "")
+        parameters = self._extract_parameters(operation)
+        request_body = self._extract_request_body(operation)
+        responses = self._extract_responses(operation)
+        security = self._extract_security(operation)
+
+        # Built as parts + one join; sections are JSON so the LLM sees parseable structures
+        parts = [
+            f"{method.upper()} {path}\n\n{summary}\n\nParameters:\n",
+            json.dumps(parameters, default=str),
+        ]
+        if request_body:
+            parts += ["\n\nRequest Body:\n", json.dumps(request_body, default=str)]
+        parts += [
+            "\n\nResponses:\n", json.dumps(responses, default=str),
+            "\n\nSecurity: ", ",".join(security),
+        ]
+        base_text = "".join(parts)
+
+        return {
+            "id": self._generate_chunk_id(base_text),
+            "type": ChunkType.SWAGGER,
+            "text": base_text.strip(),
+            "metadata": {
+                **self._swagger_base_meta,
+                "method": method,
+                "path": path,
+                "operation_id": operation_id
+            }
+        }
+
     def _extract_parameters(self, operation: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Gathers all parameters (path, query, header, cookie) for an operation.
@@ -12,12 +12,24 @@ Exposed Classes:
 - VectorStore
 """
 
-from backend.embeddings.embedding_engine import EmbeddingEngine
+from importlib import import_module
+
 from backend.embeddings.embedding_cache import EmbeddingCache
-from backend.embeddings.vector_store import VectorStore
 
 __all__ = [
     "EmbeddingEngine",
     "EmbeddingCache",
     "VectorStore"
 ]
+
+# Heavy classes (torch / sentence-transformers / chromadb) resolved on first access
+_LAZY_CLASSES = {
+    "EmbeddingEngine": "backend.embeddings.embedding_engine",
+    "VectorStore": "backend.embeddings.vector_store",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CLASSES:
+        return getattr(import_module(_LAZY_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
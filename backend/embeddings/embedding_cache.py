@@ -3,16 +3,50 @@ Embedding Cache Module
 
 - Prevents redundant embedding computation
 - Supports metadata-aware hashing
-- Provides persistent caching using JSON
+- Provides persistent caching using a memory-mapped float32 matrix
 - Multiprocessing-safe with file locks
 """
 
-import hashlib
-import json
+import os
+import re
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple, Union
+
+import numpy as np
+import orjson
+import xxhash
 from filelock import FileLock
 
+from backend.utils.logger import logger
+
+Vector = Union[List[float], np.ndarray]
+
+_DIM_HEADER = "#dim"
+# Appends hold the lock for microseconds; keep waits short so workers don't stall
+_LOCK_TIMEOUT = 2
+
+
+def _encode_field(value: Any) -> bytes:
+    # str.encode keeps str-based enums (e.g. ChunkType) equal to their raw values;
+    # anything else is serialized with sorted keys so nested dicts hash stably
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+
+
+def _parse_key_lines(data: bytes) -> Iterator[Tuple[str, str]]:
+    for line in data.decode("utf-8").splitlines():
+        key, _, value = line.partition("\t")
+        if value:
+            yield key, value
+
+
+def _write_durably(path: Path, data: bytes) -> None:
+    with path.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
 
 class EmbeddingCache:
     """
@@ -21,48 +55,315 @@ class EmbeddingCache:
     between Swagger/Postman chunks that have same surface text but different source.
 
     Uses:
-    - SHA-256 based deduplication
-    - Persistent disk cache (index.json)
+    - XXH3-128 based deduplication
+    - Contiguous float32 matrix on disk (vectors.f32), memory-mapped read-only and
+      shared between worker processes through the OS page cache
+    - Optional int8 quantization (vectors.q8): per-row fp32 scale + int8 values, 4x smaller
+    - Append-only key index (keys.tsv) mapping hash -> row, compacted lazily
     - File locking to ensure multiprocessing safety
     """
 
-    def __init__(self, cache_dir: str = "backend/data/vector_cache/.embedding_cache"):
+    def __init__(
+        self,
+        cache_dir: str = "backend/data/vector_cache/.embedding_cache",
+        quantize: bool = False,
+        model_name: Optional[str] = None
+    ):
+        """
+        Initializes the cache and loads the on-disk index.
+
+        Args:
+            cache_dir (str): Root directory for the cache files.
+            quantize (bool): Store rows as int8 with a per-row scale.
+            model_name (Optional[str]): Embedding model the vectors come from. Each
+                model gets its own subdirectory, since vectors (and their dimension)
+                are not interchangeable between models.
+        """
         self.cache_dir = Path(cache_dir)
+        if model_name:
+            self.cache_dir /= re.sub(r"[^A-Za-z0-9._-]", "_", model_name)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.quantize = quantize
 
-        self.index_file = self.cache_dir / "index.json"
+        if quantize:
+            self.vectors_file = self.cache_dir / "vectors.q8"
+            self.keys_file = self.cache_dir / "keys.q8.tsv"
+        else:
+            self.vectors_file = self.cache_dir / "vectors.f32"
+            self.keys_file = self.cache_dir / "keys.tsv"
         self.lock_file = self.cache_dir / "index.lock"
-        self._cache: Dict[str, List[float]] = self._load_index()
 
-    def _load_index(self) -> Dict[str, List[float]]:
-        if not self.index_file.exists():
-            return {}
+        self._dim: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._mm: Optional[np.memmap] = None
+        self._mapped_inode: Optional[int] = None
+        self._keys_offset = 0
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """
+        Loads the key index and maps the vector matrix, compacting both first
+        if superseded rows make up more than half of the matrix.
+
+        Files are only ever appended to or atomically replaced, so if another
+        process holds the lock the index is still read, just without repairs
+        or compaction.
+        """
+        self._reset()
+        if not self.keys_file.exists():
+            return
+
+        try:
+            with FileLock(str(self.lock_file), timeout=_LOCK_TIMEOUT):
+                self._read_index(maintain=True)
+        except TimeoutError:
+            logger.warning("⚠️ Embedding cache is locked by another process; loading without compaction.")
+            self._read_index(maintain=False)
+
+    def _reset(self) -> None:
+        self._dim, self._rows, self._mm, self._mapped_inode = None, {}, None, None
+        self._keys_offset = 0
+
+    def _read_index(self, maintain: bool) -> None:
+        self._dim, rows, self._keys_offset = self._read_keys(repair=maintain)
+        if self._dim is None:
+            return
+
+        n_rows = self._row_count()
+        if any(row >= n_rows for row in rows.values()):
+            # Rows are always written before their keys, so this only happens if a
+            # compaction was interrupted between its two renames; never serve those rows.
+            logger.warning("⚠️ Embedding cache index does not match its vectors; starting empty.")
+            self._dim, self._keys_offset = None, 0
+            if maintain:
+                self._discard_files()
+            return
+
+        self._rows = rows
+        if maintain and n_rows > 2 * len(self._rows):
+            self._rewrite(n_rows)
+            return
+
+        if (
+            maintain
+            and self.vectors_file.exists()
+            and self.vectors_file.stat().st_size > n_rows * self._row_bytes
+        ):
+            # Drop a torn trailing row so later appends stay aligned
+            os.truncate(self.vectors_file, n_rows * self._row_bytes)
+        self._remap()
+
+    @property
+    def _row_dtype(self) -> np.dtype:
+        if self.quantize:
+            return np.dtype([("scale", "<f4"), ("q", "i1", (self._dim,))])
+        return np.dtype(("<f4", (self._dim,)))
+
+    @property
+    def _row_bytes(self) -> int:
+        return self._row_dtype.itemsize
+
+    def _map_rows(self, n_rows: int) -> np.memmap:
+        return np.memmap(self.vectors_file, dtype=self._row_dtype, mode="r", shape=(n_rows,))
+
+    def _encode_rows(self, matrix: np.ndarray) -> bytes:
+        """
+        Serializes a float32 (n, dim) matrix into on-disk rows. In quantized
+        mode each row is scaled by its abs-max so values fit int8 [-127, 127].
+        """
+        if not self.quantize:
+            return matrix.tobytes()
+
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        records = np.empty(len(matrix), dtype=self._row_dtype)
+        records["scale"] = scales
+        records["q"] = np.clip(np.round(matrix / scales[:, None]), -127, 127)
+        return records.tobytes()
+
+    def _row_count(self) -> int:
+        if not self._dim or not self.vectors_file.exists():
+            return 0
+        return self.vectors_file.stat().st_size // self._row_bytes
+
+    def _read_keys(self, repair: bool = True) -> Tuple[Optional[int], Dict[str, int], int]:
+        """
+        Parses keys.tsv. Later lines for the same key win; an unterminated
+        trailing line (e.g. from an interrupted write) is ignored, and truncated
+        away when repair is set (callers must hold the lock).
+
+        Returns:
+            Tuple[Optional[int], Dict[str, int], int]: Dimension, key -> row map,
+            and the byte offset up to which the file was consumed.
+        """
+        raw = self.keys_file.read_bytes()
+        consumed = raw.rfind(b"\n") + 1
+        if repair and consumed < len(raw):
+            os.truncate(self.keys_file, consumed)
+
+        dim: Optional[int] = None
+        rows: Dict[str, int] = {}
+        for key, value in _parse_key_lines(raw[:consumed]):
+            if key == _DIM_HEADER:
+                dim = int(value)
+            else:
+                rows[key] = int(value)
+        return dim, rows, consumed
+
+    def _read_key_tail(self) -> bool:
+        """
+        Reads key lines appended since the last read and merges them in.
+
+        Returns:
+            bool: True if any new keys were found.
+        """
+        with self.keys_file.open("rb") as f:
+            f.seek(self._keys_offset)
+            tail = f.read()
+        consumed = tail.rfind(b"\n") + 1
+        if not consumed:
+            return False
+
+        self._rows.update((key, int(value)) for key, value in _parse_key_lines(tail[:consumed]))
+        self._keys_offset += consumed
+        return True
+
+    def _files_replaced(self) -> bool:
+        """
+        True if another process compacted or cleared the files we have mapped.
+        """
+        if self._mapped_inode is None:
+            return False
+        return not self.vectors_file.exists() or self.vectors_file.stat().st_ino != self._mapped_inode
+
+    def _rewrite(self, n_rows: int) -> None:
+        """
+        Writes live rows to fresh files and swaps them in, so other processes
+        still mapping the old matrix are unaffected.
+        """
+        keys = list(self._rows)
+        old = self._map_rows(n_rows)
+        live = old[[self._rows[k] for k in keys]] if keys else np.empty(0, dtype=self._row_dtype)
+        del old
+
+        vectors_tmp = self.vectors_file.with_name(self.vectors_file.name + ".tmp")
+        keys_tmp = self.keys_file.with_name(self.keys_file.name + ".tmp")
+        _write_durably(vectors_tmp, live.tobytes())
+        keys_data = (
+            f"{_DIM_HEADER}\t{self._dim}\n" + "".join(f"{k}\t{i}\n" for i, k in enumerate(keys))
+        ).encode("utf-8")
+        _write_durably(keys_tmp, keys_data)
+        # Vectors first: a crash between the renames leaves old keys pointing past
+        # the end of the (shorter) new matrix, which _read_index detects.
+        os.replace(vectors_tmp, self.vectors_file)
+        os.replace(keys_tmp, self.keys_file)
 
+        self._rows = {k: i for i, k in enumerate(keys)}
+        self._keys_offset = len(keys_data)
+        self._remap()
+
+    def _remap(self) -> None:
+        n_rows = self._row_count()
+        self._mm = self._map_rows(n_rows) if n_rows else None
+        self._mapped_inode = self.vectors_file.stat().st_ino if n_rows else None
+
+    def _append_rows(self, entries: Dict[str, Vector]) -> None:
+        """
+        Appends vectors to the matrix and their row numbers to the key index.
+        """
+        matrix = np.asarray(list(entries.values()), dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("All embeddings in a batch must share one dimension.")
+
+        with FileLock(str(self.lock_file), timeout=_LOCK_TIMEOUT):
+            # Catch up with other processes so our offsets and row numbers stay valid
+            if not self.keys_file.exists():
+                # Never written, or cleared by another instance: start like a new cache
+                self._reset()
+            elif self._dim is None or self._files_replaced():
+                self._dim, self._rows, self._keys_offset = self._read_keys()
+            else:
+                self._read_key_tail()
+            if self._dim is None:
+                self._dim = matrix.shape[1]
+                header = f"{_DIM_HEADER}\t{self._dim}\n".encode("utf-8")
+                self.keys_file.write_bytes(header)
+                self._rows, self._keys_offset = {}, len(header)
+            if matrix.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} does not match cache dimension {self._dim}; "
+                    f"clear the cache after switching models."
+                )
+
+            # A crashed writer can leave a torn trailing row or key line; cut both back
+            # to the last complete record so new rows land where their keys point.
+            start = self._row_count()
+            if self.vectors_file.exists() and self.vectors_file.stat().st_size > start * self._row_bytes:
+                os.truncate(self.vectors_file, start * self._row_bytes)
+            if self.keys_file.stat().st_size > self._keys_offset:
+                os.truncate(self.keys_file, self._keys_offset)
+
+            with self.vectors_file.open("ab") as f:
+                f.write(self._encode_rows(matrix))
+            key_lines = "".join(f"{k}\t{start + i}\n" for i, k in enumerate(entries)).encode("utf-8")
+            with self.keys_file.open("ab") as f:
+                f.write(key_lines)
+
+            self._rows.update({k: start + i for i, k in enumerate(entries)})
+            self._keys_offset += len(key_lines)
+            self._remap()
+
+    def refresh(self) -> None:
+        """
+        Picks up entries appended by other processes (e.g. parallel workers)
+        since this instance last read the index. Only the new tail of keys.tsv
+        is read; the vector matrix is shared through the OS page cache, so
+        workers never hold private copies of it.
+
+        Runs under the lock so a concurrent compaction cannot swap the files
+        between the replacement check and the tail read. If the lock is busy,
+        the refresh is skipped and this instance keeps serving its current view.
+        """
         try:
-            with FileLock(str(self.lock_file), timeout=10):
-                with self.index_file.open("r", encoding="utf-8") as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, TimeoutError):
-            return {}
+            with FileLock(str(self.lock_file), timeout=_LOCK_TIMEOUT):
+                if self._dim is None or self._files_replaced() or not self.keys_file.exists():
+                    self._reset()
+                    if self.keys_file.exists():
+                        self._read_index(maintain=True)
+                elif self._read_key_tail():
+                    self._remap()
+        except TimeoutError:
+            logger.debug("🔒 Embedding cache is locked by another process; skipping refresh.")
 
-    def _save_index(self) -> None:
-        with FileLock(str(self.lock_file), timeout=10):
-            with self.index_file.open("w", encoding="utf-8") as f:
-                json.dump(self._cache, f, indent=2)
+    def compact(self) -> None:
+        """
+        Reloads the index (picking up entries written by other processes) and
+        rewrites the files with only live rows if superseded rows make up more
+        than half of the matrix.
+        """
+        self._load_index()
 
     @staticmethod
     def _compute_hash(text: str, metadata: Optional[Dict] = None) -> str:
         """
-        Returns SHA-256 hash of the input text + metadata.
+        Returns a 128-bit XXH3 hash of the input text + metadata.
+        The key is only used for lookups, so a non-cryptographic hash suffices.
+
+        Fields are fed to the hasher as framed raw bytes (length-prefixed text,
+        then sorted key/value pairs) rather than through a JSON dump.
         """
-        normalized = {
-            "text": text.strip(),
-            "metadata": metadata or {}
-        }
-        encoded = json.dumps(normalized, sort_keys=True).encode("utf-8")
-        return hashlib.sha256(encoded).hexdigest()
+        stripped = text.strip().encode("utf-8")
+        hasher = xxhash.xxh3_128(len(stripped).to_bytes(8, "little"))
+        hasher.update(stripped)
+        if metadata:
+            for key in sorted(metadata):
+                hasher.update(_encode_field(key))
+                hasher.update(b"\x00")
+                hasher.update(_encode_field(metadata[key]))
+                hasher.update(b"\x01")
+        return hasher.hexdigest()
 
-    def get(self, text: str, metadata: Optional[Dict] = None) -> Optional[List[float]]:
+    def get(self, text: str, metadata: Optional[Dict] = None) -> Optional[np.ndarray]:
         """
         Retrieves an embedding from the cache if available.
 
@@ -71,34 +372,77 @@ class EmbeddingCache:
             metadata (Optional[Dict]): Optional metadata affecting uniqueness.
 
         Returns:
-            Optional[List[float]]: The cached embedding, if found.
+            Optional[np.ndarray]: The cached float32 embedding, if found. Unquantized
+            caches return a read-only view of the mapped row.
+        """
+        return self._read_row(self._rows.get(self._compute_hash(text, metadata)))
+
+    def get_many(self, items: List[Tuple[str, Optional[Dict]]]) -> List[Optional[np.ndarray]]:
+        """
+        Retrieves several embeddings in one pass.
+
+        Args:
+            items (List[Tuple[str, Optional[Dict]]]): (text, metadata) pairs.
+
+        Returns:
+            List[Optional[np.ndarray]]: Cached embeddings (or None) in input order.
         """
-        key = self._compute_hash(text, metadata)
-        return self._cache.get(key)
+        rows = self._rows
+        return [
+            self._read_row(rows.get(self._compute_hash(text, metadata)))
+            for text, metadata in items
+        ]
+
+    def _read_row(self, row: Optional[int]) -> Optional[np.ndarray]:
+        if row is None:
+            return None
+        if self.quantize:
+            record = self._mm[row]
+            return record["q"].astype(np.float32) * record["scale"]
+        return self._mm[row]
 
-    def add(self, text: str, embedding: List[float], metadata: Optional[Dict] = None) -> None:
+    def add(self, text: str, embedding: Vector, metadata: Optional[Dict] = None) -> None:
         """
-        Adds a new embedding to the cache and persists it.
+        Adds a new embedding to the cache and appends it to disk.
 
         Args:
             text (str): Original input text.
-            embedding (List[float]): Corresponding embedding vector.
+            embedding (List[float] | np.ndarray): Corresponding embedding vector.
             metadata (Optional[Dict]): Optional hash-affecting metadata.
         """
-        key = self._compute_hash(text, metadata)
-        self._cache[key] = embedding
-        self._save_index()
+        self._append_rows({self._compute_hash(text, metadata): embedding})
+
+    def add_many(self, items: List[Tuple[str, Vector, Optional[Dict]]]) -> None:
+        """
+        Adds several embeddings and persists them with a single lock acquisition
+        and a single write.
+
+        Args:
+            items (List[Tuple[str, Vector, Optional[Dict]]]):
+                (text, embedding, metadata) triples.
+        """
+        if not items:
+            return
+
+        self._append_rows({
+            self._compute_hash(text, metadata): embedding
+            for text, embedding, metadata in items
+        })
 
     def clear(self) -> None:
         """
         Clears the in-memory and on-disk cache.
         """
-        self._cache.clear()
-        if self.index_file.exists():
-            self.index_file.unlink()
+        self._reset()
+        self._discard_files()
+
+    def _discard_files(self) -> None:
+        for path in (self.vectors_file, self.keys_file):
+            if path.exists():
+                path.unlink()
 
     def size(self) -> int:
         """
         Returns the number of cached entries.
         """
-        return len(self._cache)
+        return len(self._rows)
@@ -12,7 +12,7 @@ import torch
 from sentence_transformers import SentenceTransformer
 
 from backend.utils.logger import logger
-from backend.utils.config import config
+from backend.utils.config import get_config
 from backend.utils.constants import ChunkType
 from backend.embeddings.embedding_cache import EmbeddingCache
 
@@ -25,13 +25,18 @@ class EmbeddingEngine:
     """
 
     def __init__(self):
+        config = get_config()
         self.model_name = config.embedding_model_name
         self.batch_size = config.embedding_batch_size
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.cache = EmbeddingCache()
+        self.cache = EmbeddingCache(model_name=self.model_name)
 
         try:
             self.model = SentenceTransformer(self.model_name, device=self.device)
+            if self.device == "cuda":
+                # fp16 halves VRAM per token, so the same memory fits twice the batch
+                self.model.half()
+                self.batch_size *= 2
             logger.success(f"✅ Embedding model loaded: {self.model_name} on {self.device}")
         except Exception as e:
             raise RuntimeError(f"Failed to load embedding model [{self.model_name}]: {e}")
@@ -64,11 +69,14 @@ class EmbeddingEngine:
         to_embed = []
         enriched_chunks = []
 
-        for chunk in validated_chunks:
-            cached = self.cache.get(chunk["text"], metadata={"type": chunk["type"]})
-            if cached:
+        # Pick up vectors other workers have cached since this engine was created
+        self.cache.refresh()
+        cached_vectors = self.cache.get_many([(c["text"], {"type": c["type"]}) for c in validated_chunks])
+
+        for chunk, cached in zip(validated_chunks, cached_vectors):
+            if cached is not None:
                 logger.debug(f"🧠 Using cached embedding for chunk: {chunk['id']}")
-                chunk["embedding"] = cached
+                chunk["embedding"] = cached.tolist()
                 enriched_chunks.append(chunk)
             else:
                 to_embed.append(chunk)
@@ -76,21 +84,34 @@ class EmbeddingEngine:
         # Embed new ones
         if to_embed:
             logger.info(f"🔄 Embedding {len(to_embed)} new chunks...")
-            texts = [c["text"] for c in to_embed]
-            embeddings = self.model.encode(
-                texts,
-                batch_size=self.batch_size,
-                show_progress_bar=True,
-                convert_to_numpy=True,
-                normalize_embeddings=True
-            )
-
-            for i, chunk in enumerate(to_embed):
-                vector = embeddings[i].tolist()
-                chunk["embedding"] = vector
+            # Identical texts share one encode; dict preserves first-seen order
+            unique: Dict[str, int] = {}
+            for c in to_embed:
+                unique.setdefault(c["text"], len(unique))
+            logger.debug(f"🧮 Deduplicated {len(to_embed)} chunks to {len(unique)} unique texts")
+
+            with torch.inference_mode():
+                embeddings = self.model.encode(
+                    list(unique),
+                    batch_size=self.batch_size,
+                    show_progress_bar=True,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+
+            pending = []
+            for chunk in to_embed:
+                vector = embeddings[unique[chunk["text"]]]
+                chunk["embedding"] = vector.tolist()
                 enriched_chunks.append(chunk)
-                self.cache.add(chunk["text"], vector, metadata={"type": chunk["type"]})
-
-            logger.success("✅ New embeddings computed and cached.")
+                pending.append((chunk["text"], vector, {"type": chunk["type"]}))
+
+            try:
+                self.cache.add_many(pending)
+                logger.success("✅ New embeddings computed and cached.")
+            except (ValueError, TimeoutError, OSError) as e:
+                # The vectors are still valid for this call; only persisting them failed
+                # (dimension mismatch, lock held past the timeout, or an I/O error)
+                logger.warning(f"⚠️ Skipping embedding cache write: {e}")
 
         return enriched_chunks
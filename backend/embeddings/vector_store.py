@@ -7,6 +7,7 @@ Vector Store Module for Swagger-to-Postman AI Agent
 - Handles custom metadata tagging (origin, filename, type, hash)
 """
 
+from functools import lru_cache
 from uuid import uuid4
 from typing import List, Dict, Optional
 
@@ -27,6 +28,45 @@ from backend.utils.constants import (
 )
 
 
+@lru_cache(maxsize=4)
+def _get_embed_fn(model_name: str) -> SentenceTransformerEmbeddingFunction:
+    """
+    Returns a process-wide embedding function per model, so every VectorStore
+    shares one set of loaded weights.
+    """
+    return SentenceTransformerEmbeddingFunction(model_name=model_name)
+
+
+_ENRICHED_FIELDS = (METADATA_FIELD_TYPE, METADATA_FIELD_ORIGIN, METADATA_FIELD_FILENAME, METADATA_FIELD_HASH)
+
+
+def _enrich_metadatas(count: int, metadatas: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """
+    Fills the standard metadata fields for each document, keeping any values
+    the caller supplied. Each field is gathered as its own column first and
+    the per-document dicts are assembled in a single pass.
+
+    Args:
+        count (int): Number of documents.
+        metadatas (Optional[List[Dict]]): Caller metadata, possibly shorter than count.
+
+    Returns:
+        List[Dict]: One enriched metadata dict per document.
+    """
+    base_metas = list(metadatas or [])[:count]
+    base_metas += [{}] * (count - len(base_metas))
+
+    types = [m.get(METADATA_FIELD_TYPE, "text") for m in base_metas]
+    origins = [m.get(METADATA_FIELD_ORIGIN, "unknown") for m in base_metas]
+    filenames = [m.get(METADATA_FIELD_FILENAME, "unknown") for m in base_metas]
+    hashes = [m[METADATA_FIELD_HASH] if METADATA_FIELD_HASH in m else str(uuid4()) for m in base_metas]
+
+    return [
+        {**dict(zip(_ENRICHED_FIELDS, fields)), **meta}
+        for fields, meta in zip(zip(types, origins, filenames, hashes), base_metas)
+    ]
+
+
 class VectorStore:
     """
     Wrapper for ChromaDB persistent vector store with semantic embeddings.
@@ -47,9 +87,7 @@ class VectorStore:
             chroma_db_impl="duckdb+parquet",
             persist_directory=self.persist_directory
         ))
-        self.embedding_function = SentenceTransformerEmbeddingFunction(
-            model_name=EMBEDDING_MODEL_NAME
-        )
+        self.embedding_function = _get_embed_fn(EMBEDDING_MODEL_NAME)
         self._collections: Dict[str, Collection] = {}
 
         logger.success(f"✅ Initialized VectorStore at: {self.persist_directory}")
@@ -110,16 +148,7 @@ class VectorStore:
         if len(ids) != len(documents):
             raise ValueError("Mismatch: documents and IDs count.")
 
-        enriched_metadatas = []
-        for i, doc in enumerate(documents):
-            base_meta = metadatas[i] if metadatas and i < len(metadatas) else {}
-            enriched_metadatas.append({
-                METADATA_FIELD_TYPE: base_meta.get(METADATA_FIELD_TYPE, "text"),
-                METADATA_FIELD_ORIGIN: base_meta.get(METADATA_FIELD_ORIGIN, "unknown"),
-                METADATA_FIELD_FILENAME: base_meta.get(METADATA_FIELD_FILENAME, "unknown"),
-                METADATA_FIELD_HASH: base_meta.get(METADATA_FIELD_HASH, str(uuid4())),
-                **base_meta
-            })
+        enriched_metadatas = _enrich_metadatas(len(documents), metadatas)
 
         collection = self._load_or_create_collection(collection_name)
         collection.add(
@@ -155,16 +184,7 @@ class VectorStore:
         if len(ids) != len(documents):
             raise ValueError("Mismatch: documents and IDs count.")
 
-        enriched_metadatas = []
-        for i, doc in enumerate(documents):
-            base_meta = metadatas[i] if metadatas and i < len(metadatas) else {}
-            enriched_metadatas.append({
-                METADATA_FIELD_TYPE: base_meta.get(METADATA_FIELD_TYPE, "text"),
-                METADATA_FIELD_ORIGIN: base_meta.get(METADATA_FIELD_ORIGIN, "unknown"),
-                METADATA_FIELD_FILENAME: base_meta.get(METADATA_FIELD_FILENAME, "unknown"),
-                METADATA_FIELD_HASH: base_meta.get(METADATA_FIELD_HASH, str(uuid4())),
-                **base_meta
-            })
+        enriched_metadatas = _enrich_metadatas(len(documents), metadatas)
 
         embeddings = self.embedding_function(documents)
         collection = self._load_or_create_collection(collection_name)
@@ -181,7 +201,8 @@ class VectorStore:
         self,
         collection_name: VectorStoreCollections,
         query_texts: List[str],
-        n_results: int = 5
+        n_results: int = 5,
+        query_embeddings: Optional[List[List[float]]] = None
     ) -> List[Dict]:
         """
         Performs semantic similarity search against stored vectors.
@@ -190,16 +211,27 @@ class VectorStore:
             collection_name (VectorStoreCollections): Target collection.
             query_texts (List[str]): Input queries.
             n_results (int): Top-N results.
+            query_embeddings (Optional[List[List[float]]]): Precomputed embeddings of
+                query_texts (e.g. from EmbeddingEngine); skips re-embedding in ChromaDB.
 
         Returns:
             List[Dict]: Matches for each query.
         """
         collection = self._load_or_create_collection(collection_name)
-        results = collection.query(
-            query_texts=query_texts,
-            n_results=n_results,
-            include=["documents", "metadatas", "distances"]
-        )
+        if query_embeddings is not None:
+            if len(query_embeddings) != len(query_texts):
+                raise ValueError("Mismatch: query texts and query embeddings count.")
+            results = collection.query(
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"]
+            )
+        else:
+            results = collection.query(
+                query_texts=query_texts,
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"]
+            )
 
         output = []
         for i, query in enumerate(query_texts):
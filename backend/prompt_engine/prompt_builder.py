@@ -8,16 +8,20 @@ Provides:
 - YAML parsing with internal caching
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
 from pathlib import Path
 import yaml
-from jinja2 import Template, TemplateError
+from jinja2 import BaseLoader, Environment, StrictUndefined, Template, TemplateError
 
 from backend.utils.constants import PromptTemplateKey
 from backend.utils.logger import logger
+from backend.utils.yaml_compat import load_yaml_cached
 
 PROMPT_TEMPLATE_PATH = Path("backend/prompt_engine/prompt_templates.yaml")
 
+# Flattens line breaks and tabs in template previews
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
 
 class PromptBuilder:
     """
@@ -32,17 +36,39 @@ class PromptBuilder:
         Args:
             template_path (Path): Path to the YAML prompt template file.
         """
-        self._raw_templates: Dict[str, str] = self._load_templates(template_path)
+        self._raw_templates: Mapping[str, str] = self._load_templates(template_path)
+
+        # Compile every template once; render() only executes the compiled code.
+        # Prompts are plain text (no autoescape) and missing variables fail fast.
+        self._env = Environment(
+            loader=BaseLoader(),
+            autoescape=False,
+            undefined=StrictUndefined,
+            optimized=True,
+            cache_size=-1,
+            auto_reload=False,
+            keep_trailing_newline=False,
+        )
+        self._compiled: Dict[str, Template] = {
+            k: self._env.from_string(v) for k, v in self._raw_templates.items()
+        }
 
-    def _load_templates(self, path: Path) -> Dict[str, str]:
+        # Templates are immutable after load, so previews are computed once
+        self._previews: Dict[str, str] = {
+            k: v[:80].translate(_WS_TABLE).strip() + "..."
+            for k, v in self._raw_templates.items()
+        }
+
+    def _load_templates(self, path: Path) -> Mapping[str, str]:
         """
         Loads YAML prompt templates from disk.
+        Parsing is cached per process until the file changes.
 
         Args:
             path (Path): Path to YAML file.
 
         Returns:
-            Dict[str, str]: Mapping of prompt name -> template string.
+            Mapping[str, str]: Read-only mapping of prompt name -> template string.
 
         Raises:
             RuntimeError: If YAML parsing fails.
@@ -51,12 +77,11 @@ class PromptBuilder:
             raise FileNotFoundError(f"Prompt template file not found: {path}")
 
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if not isinstance(data, dict):
-                    raise ValueError("Prompt template YAML must be a dictionary at the top level.")
-                logger.success(f"✅ Loaded prompt templates from {path}")
-                return data
+            data = load_yaml_cached(path)
+            if not isinstance(data, Mapping):
+                raise ValueError("Prompt template YAML must be a dictionary at the top level.")
+            logger.success(f"✅ Loaded prompt templates from {path}")
+            return data
         except yaml.YAMLError as e:
             raise RuntimeError(f"Failed to parse prompt YAML: {e}")
 
@@ -73,15 +98,14 @@ class PromptBuilder:
 
         Raises:
             KeyError: If the prompt key is not found.
-            TemplateError: If Jinja2 rendering fails.
+            TemplateError: If Jinja2 rendering fails or a variable is missing.
         """
-        raw_template = self._raw_templates.get(key.value)
-        if raw_template is None:
+        template = self._compiled.get(key.value)
+        if template is None:
             raise KeyError(f"Prompt template '{key.value}' not found.")
 
         try:
-            template = Template(raw_template)
-            rendered = template.render(**variables)
+            rendered = template.render(variables)
             logger.debug(f"🧠 Rendered prompt for key [{key.value}] with {len(variables)} variable(s)")
             return rendered
         except TemplateError as e:
@@ -94,7 +118,4 @@ class PromptBuilder:
         Returns:
             Dict[str, str]: Key name -> truncated preview
         """
-        return {
-            k: v[:80].strip().replace("\n", " ") + "..."
-            for k, v in self._raw_templates.items()
-        }
+        return self._previews
@@ -0,0 +1,168 @@
+"""
+Tests for the on-disk embedding cache used by the EmbeddingEngine.
+
+Covers persistence across reloads, compaction, crash recovery (torn
+vector rows and unterminated key lines), int8 quantization, and
+cross-instance visibility through refresh().
+"""
+
+import numpy as np
+import pytest
+
+from backend.embeddings.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def test_round_trip_after_reload(cache_dir):
+    cache = EmbeddingCache(cache_dir)
+    cache.add("alpha", [1.0, 2.0, 3.0], {"type": "swagger"})
+    cache.add_many([
+        ("beta", [4.0, 5.0, 6.0], None),
+        ("gamma", np.array([7.0, 8.0, 9.0]), {"type": "text"}),
+    ])
+
+    reloaded = EmbeddingCache(cache_dir)
+    assert reloaded.size() == 3
+    np.testing.assert_array_equal(reloaded.get("alpha", {"type": "swagger"}), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(reloaded.get("beta"), [4.0, 5.0, 6.0])
+    np.testing.assert_array_equal(reloaded.get("gamma", {"type": "text"}), [7.0, 8.0, 9.0])
+    # Metadata is part of the key
+    assert reloaded.get("alpha") is None
+
+
+def test_compaction_drops_superseded_rows(cache_dir):
+    cache = EmbeddingCache(cache_dir)
+    for i in range(5):
+        cache.add("same", [float(i), float(i)])
+    cache.add("other", [9.0, 9.0])
+    assert cache.vectors_file.stat().st_size == 6 * cache._row_bytes
+
+    cache.compact()
+
+    assert cache.vectors_file.stat().st_size == 2 * cache._row_bytes
+    np.testing.assert_array_equal(cache.get("same"), [4.0, 4.0])
+    np.testing.assert_array_equal(cache.get("other"), [9.0, 9.0])
+
+    reloaded = EmbeddingCache(cache_dir)
+    assert reloaded.size() == 2
+    np.testing.assert_array_equal(reloaded.get("same"), [4.0, 4.0])
+
+
+def test_recovers_from_torn_vector_row_and_key_line(cache_dir):
+    cache = EmbeddingCache(cache_dir)
+    cache.add("alpha", [1.0, 2.0, 3.0])
+
+    # Simulate a writer that crashed mid-append
+    with cache.vectors_file.open("ab") as f:
+        f.write(b"\x00" * 5)
+    with cache.keys_file.open("ab") as f:
+        f.write(b"deadbeef\t1")
+
+    # An instance that was already running must stay aligned
+    cache.add("beta", [4.0, 5.0, 6.0])
+    np.testing.assert_array_equal(cache.get("beta"), [4.0, 5.0, 6.0])
+
+    reloaded = EmbeddingCache(cache_dir)
+    assert reloaded.size() == 2
+    np.testing.assert_array_equal(reloaded.get("alpha"), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(reloaded.get("beta"), [4.0, 5.0, 6.0])
+
+
+def test_load_truncates_torn_tails(cache_dir):
+    cache = EmbeddingCache(cache_dir)
+    cache.add("alpha", [1.0, 2.0])
+    with cache.vectors_file.open("ab") as f:
+        f.write(b"\x01\x02\x03")
+    with cache.keys_file.open("ab") as f:
+        f.write(b"partial")
+
+    reloaded = EmbeddingCache(cache_dir)
+    assert reloaded.vectors_file.stat().st_size == reloaded._row_bytes
+    assert reloaded.keys_file.read_bytes().endswith(b"\n")
+    np.testing.assert_array_equal(reloaded.get("alpha"), [1.0, 2.0])
+
+
+def test_quantized_round_trip(cache_dir):
+    vector = np.array([0.5, -0.25, 0.125, -1.0], dtype=np.float32)
+    cache = EmbeddingCache(cache_dir, quantize=True)
+    cache.add("alpha", vector)
+    cache.add("zeros", [0.0, 0.0, 0.0, 0.0])
+
+    reloaded = EmbeddingCache(cache_dir, quantize=True)
+    np.testing.assert_allclose(reloaded.get("alpha"), vector, atol=1.0 / 127)
+    np.testing.assert_array_equal(reloaded.get("zeros"), [0.0, 0.0, 0.0, 0.0])
+    # Quantized rows use their own files and never leak into the float32 cache
+    assert EmbeddingCache(cache_dir).get("alpha") is None
+
+
+def test_refresh_picks_up_appends_from_other_instance(cache_dir):
+    writer = EmbeddingCache(cache_dir)
+    reader = EmbeddingCache(cache_dir)
+    assert reader.get("alpha") is None
+
+    writer.add("alpha", [1.0, 2.0])
+    reader.refresh()
+    np.testing.assert_array_equal(reader.get("alpha"), [1.0, 2.0])
+
+    # Survives the writer compacting (replacing both files) in between
+    for i in range(4):
+        writer.add("alpha", [float(i), float(i)])
+    writer.compact()
+    writer.add("beta", [5.0, 6.0])
+    reader.refresh()
+    assert reader.size() == 2
+    np.testing.assert_array_equal(reader.get("alpha"), [3.0, 3.0])
+    np.testing.assert_array_equal(reader.get("beta"), [5.0, 6.0])
+
+
+def test_add_after_other_instance_clears(cache_dir):
+    first = EmbeddingCache(cache_dir)
+    second = EmbeddingCache(cache_dir)
+    first.add("alpha", [1.0, 2.0])
+
+    second.clear()
+    first.add("beta", [3.0, 4.0, 5.0])
+
+    assert first.size() == 1
+    assert first.get("alpha") is None
+    np.testing.assert_array_equal(first.get("beta"), [3.0, 4.0, 5.0])
+
+    second.refresh()
+    np.testing.assert_array_equal(second.get("beta"), [3.0, 4.0, 5.0])
+    reloaded = EmbeddingCache(cache_dir)
+    assert reloaded.size() == 1
+    np.testing.assert_array_equal(reloaded.get("beta"), [3.0, 4.0, 5.0])
+
+
+def test_refresh_after_other_instance_clears(cache_dir):
+    first = EmbeddingCache(cache_dir)
+    second = EmbeddingCache(cache_dir)
+    first.add("alpha", [1.0, 2.0])
+    second.refresh()
+
+    first.clear()
+    second.refresh()
+
+    assert second.size() == 0
+    assert second.get("alpha") is None
+
+
+def test_dimension_mismatch_raises(cache_dir):
+    cache = EmbeddingCache(cache_dir)
+    cache.add("alpha", [1.0, 2.0])
+    with pytest.raises(ValueError):
+        cache.add("beta", [1.0, 2.0, 3.0])
+
+
+def test_model_name_selects_separate_directory(cache_dir):
+    first = EmbeddingCache(cache_dir, model_name="org/model-a")
+    second = EmbeddingCache(cache_dir, model_name="org/model-b")
+    first.add("alpha", [1.0, 2.0])
+    second.add("alpha", [1.0, 2.0, 3.0])
+
+    assert first.cache_dir != second.cache_dir
+    np.testing.assert_array_equal(EmbeddingCache(cache_dir, model_name="org/model-a").get("alpha"), [1.0, 2.0])
@@ -13,14 +13,11 @@ This __init__.py enables clean, typed, and testable imports like:
 
     from backend.utils import config, logger, constants, file_loader
 
-All modules are automatically imported for convenience in downstream layers.
+Submodules are imported lazily on first attribute access, so pulling in a single
+module (e.g. constants) does not drag in dotenv, rich, yaml, or the global logger.
 """
 
-from . import config
-from . import logger
-from . import constants
-from . import file_loader
-from . import swagger_converter
+from importlib import import_module
 
 __all__ = [
     "config",
@@ -29,3 +26,13 @@ __all__ = [
     "file_loader",
     "swagger_converter",
 ]
+
+_LAZY = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,7 +11,8 @@ Features:
 """
 
 import os
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Mapping
 from pathlib import Path
 import yaml
 from dotenv import load_dotenv
@@ -20,25 +21,38 @@ from backend.utils.constants import (
     LLMMode,
     EMBEDDING_MODEL_NAME,
     CHROMA_COLLECTION_NAME,
-    CHROMA_PERSIST_DIR
+    CHROMA_PERSIST_DIR,
+    DOTENV_PATH
 )
+from backend.utils.yaml_compat import load_yaml_cached
 
 # === Paths ===
-DOTENV_PATH = Path(".env")
 YAML_CONFIG_PATH = Path("./backend/config/config.yaml")
 
-# Load environment variables (highest precedence)
-load_dotenv(DOTENV_PATH)
-
-
-def _load_yaml_config(path: Path) -> Dict[str, Any]:
+# Every key AppConfig reads; only these are picked up from the environment
+_KNOWN_CONFIG_KEYS = frozenset({
+    "LLM_MODE",
+    "OPENAI_API_KEY",
+    "TR_AUTH_TOKEN",
+    "OPENAI_MODEL",
+    "LOCAL_MODEL",
+    "TR_MODEL",
+    "EMBEDDING_MODEL",
+    "EMBEDDING_BATCH_SIZE",
+    "CHROMA_PERSIST_DIR",
+    "CHROMA_COLLECTION",
+    "AGENT_LOG_LEVEL",
+    "MAX_PARALLEL_PROCESSES",
+})
+
+
+def _load_yaml_config(path: Path) -> Mapping[str, Any]:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        try:
-            return yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            raise RuntimeError(f"Failed to parse YAML config: {e}")
+    try:
+        return load_yaml_cached(path) or {}
+    except yaml.YAMLError as e:
+        raise RuntimeError(f"Failed to parse YAML config: {e}")
 
 
 class AppConfig:
@@ -52,8 +66,15 @@ class AppConfig:
     """
 
     def __init__(self):
+        # Load environment variables (highest precedence)
+        load_dotenv(DOTENV_PATH)
+
         # === Load from YAML first ===
         self.yaml_config = _load_yaml_config(YAML_CONFIG_PATH)
+        self._merged: Dict[str, Any] = {
+            **self.yaml_config,
+            **{k: v for k, v in os.environ.items() if k in _KNOWN_CONFIG_KEYS},
+        }
 
         # === Apply values with fallback priority ===
         self.llm_mode: LLMMode = LLMMode(self._get("LLM_MODE", LLMMode.OPENAI))
@@ -85,6 +106,8 @@ class AppConfig:
         """
         Load value from ENV or YAML config, falling back to default.
 
+        Only a missing (None) value falls back; empty strings and zeros are kept.
+
         Args:
             key (str): Configuration key name.
             default (Optional[Any]): Default fallback value.
@@ -92,7 +115,8 @@ class AppConfig:
         Returns:
             Any: Loaded or default value.
         """
-        return os.getenv(key) or self.yaml_config.get(key) or default
+        val = self._merged.get(key)
+        return default if val is None else val
 
     def as_dict(self) -> Dict[str, Any]:
         """
@@ -118,4 +142,22 @@ class AppConfig:
 
 
 # === Singleton Config Instance ===
-config = AppConfig()
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """
+    Builds the shared AppConfig on first use.
+
+    Construction is deferred so importing this module stays free of file and
+    environment I/O. Tests can call `get_config.cache_clear()` to rebuild it.
+
+    Returns:
+        AppConfig: The process-wide configuration instance.
+    """
+    return AppConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: keep `from backend.utils.config import config` working lazily
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -57,11 +57,18 @@ class ChunkType(str, Enum):
 class FileType(str, Enum):
     """Supported input file types."""
     JSON = ".json"
-    YAML = [".yaml", ".yml"]
+    YAML = ".yaml"
+    YML = ".yml"
     POSTMAN_COLLECTION = ".postman_collection.json"
     POSTMAN_ENVIRONMENT = ".postman_environment.json"
 
 
+# Path.suffix values to dispatch on (Path.suffix only holds the last extension,
+# so ".postman_collection.json" files match JSON_SUFFIXES)
+JSON_SUFFIXES: Final[frozenset[str]] = frozenset({FileType.JSON.value})
+YAML_SUFFIXES: Final[frozenset[str]] = frozenset({FileType.YAML.value, FileType.YML.value})
+
+
 class PromptTemplateKey(str, Enum):
     """Keys to fetch prompt templates from the YAML template store."""
     SWAGGER_TO_TEST = "swagger_to_postman"
@@ -89,6 +96,7 @@ class LogLevel(IntEnum):
 
 # === Paths ===
 
+DOTENV_PATH = Path(".env")
 DATA_DIR = Path("backend/data")
 OUTPUT_DIR = Path("backend/output")
 LOG_DIR = OUTPUT_DIR / "logs"
@@ -96,6 +104,7 @@ VECTOR_CACHE_DIR = DATA_DIR / "vector_cache"
 SWAGGER_INPUT_DIR = DATA_DIR / "swagger"
 POSTMAN_INPUT_DIR = DATA_DIR / "postman"
 POSTMAN_OUTPUT_DIR = OUTPUT_DIR / "postman_collections"
+SPEC_CACHE_DIR = DATA_DIR / ".spec_cache"
 
 
 # === Vector Store Settings ===
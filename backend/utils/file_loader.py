@@ -12,20 +12,69 @@ Assumptions:
 - Postman follows v2 collection schema (standard Postman exports)
 """
 
+import os
+import stat
 import json
-import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Tuple
 
+from backend.utils.constants import JSON_SUFFIXES, YAML_SUFFIXES
 from backend.utils.logger import logger
-from backend.utils.constants import FileType
-from backend.utils.swagger_converter import SwaggerFormatNormalizer
+from backend.utils.swagger_converter import parse_json, parse_yaml
+
+# Required top-level keys per input kind
+_SWAGGER_REQ = frozenset({"paths"})
+_SWAGGER_VERSION_KEYS = frozenset({"openapi", "swagger"})
+_POSTMAN_REQ = frozenset({"info", "item"})
+_POSTMAN_ENV_REQ = frozenset({"values"})
 
 
 class FileLoaderError(Exception):
     """Raised when Swagger or Postman input fails to load or validate."""
 
 
+def _resolve(file_path: str, kind: str) -> Tuple[Path, str]:
+    """
+    Checks an input path with a single stat and parses its suffix once.
+
+    Args:
+        file_path (str): Path to the input file.
+        kind (str): Human-readable file kind used in error messages.
+
+    Returns:
+        Tuple[Path, str]: The path and its lower-cased suffix.
+
+    Raises:
+        FileLoaderError: If the path is missing or not a regular file.
+    """
+    path = Path(file_path)
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileLoaderError(f"{kind} file not found: {file_path}")
+    if not stat.S_ISREG(st.st_mode):
+        raise FileLoaderError(f"{kind} path is not a regular file: {file_path}")
+    return path, path.suffix.lower()
+
+
+def _load_swagger_yaml(path: Path) -> Dict[str, Any]:
+    import yaml
+
+    try:
+        return parse_yaml(path)
+    except yaml.YAMLError as e:
+        raise FileLoaderError(f"YAML parsing error: {e}")
+
+
+# Suffix -> parser dispatch tables (one dict probe per load). The shared parsers
+# import their libraries on first use, so Postman-only flows never load PyYAML.
+_SWAGGER_HANDLERS: Dict[str, Callable[[Path], Dict[str, Any]]] = {
+    **dict.fromkeys(JSON_SUFFIXES, parse_json),
+    **dict.fromkeys(YAML_SUFFIXES, _load_swagger_yaml),
+}
+_POSTMAN_HANDLERS: Dict[str, Callable[[Path], Dict[str, Any]]] = dict.fromkeys(JSON_SUFFIXES, parse_json)
+
+
 def load_swagger_file(file_path: str) -> Dict[str, Any]:
     """
     Loads a Swagger file (YAML or JSON), validates structure, and returns dict.
@@ -39,34 +88,33 @@ def load_swagger_file(file_path: str) -> Dict[str, Any]:
     Raises:
         FileLoaderError: If format is unsupported or required fields are missing.
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileLoaderError(f"❌ Swagger file not found: {file_path}")
+    path, suffix = _resolve(file_path, "Swagger")
 
     try:
-        if path.suffix.lower() == FileType.JSON:
-            # Convert JSON Swagger to YAML string first
-            yaml_string = SwaggerFormatNormalizer.to_yaml_str(path)
-            swagger_dict = yaml.safe_load(yaml_string)
-            logger.info("🔁 Swagger JSON converted to YAML for uniform processing.")
-        elif path.suffix.lower() in FileType.YAML:
-            with path.open("r", encoding="utf-8") as f:
-                swagger_dict = yaml.safe_load(f)
-        else:
-            raise FileLoaderError(f"Unsupported Swagger file extension: {path.suffix}")
+        handler = _SWAGGER_HANDLERS.get(suffix)
+        if handler is None:
+            raise FileLoaderError(f"Unsupported Swagger file extension: {suffix}")
+        swagger_dict = handler(path)
 
         # Basic Swagger/OpenAPI structure checks
-        if "paths" not in swagger_dict or not isinstance(swagger_dict["paths"], dict):
+        if not isinstance(swagger_dict, dict):
+            raise FileLoaderError("Swagger spec must be a mapping at the top level.")
+
+        if not _SWAGGER_REQ.issubset(swagger_dict):
+            missing = sorted(_SWAGGER_REQ - swagger_dict.keys())
+            raise FileLoaderError(f"Swagger spec is missing required field(s): {missing}")
+
+        if not isinstance(swagger_dict["paths"], dict):
             raise FileLoaderError("Swagger must include a valid 'paths' section.")
 
-        if "openapi" not in swagger_dict and "swagger" not in swagger_dict:
+        if _SWAGGER_VERSION_KEYS.isdisjoint(swagger_dict):
             raise FileLoaderError("Missing 'openapi' or 'swagger' field in Swagger spec.")
 
         logger.success(f"✅ Loaded Swagger: {file_path}")
         return swagger_dict
 
-    except yaml.YAMLError as e:
-        raise FileLoaderError(f"YAML parsing error: {e}")
+    except FileLoaderError:
+        raise
     except json.JSONDecodeError as e:
         raise FileLoaderError(f"JSON parsing error: {e}")
     except Exception as e:
@@ -86,23 +134,24 @@ def load_postman_file(file_path: str) -> Dict[str, Any]:
     Raises:
         FileLoaderError: If the file is missing, malformed, or invalid.
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileLoaderError(f"Postman collection file not found: {file_path}")
+    path, suffix = _resolve(file_path, "Postman collection")
 
     try:
-        if path.suffix.lower() in FileType.POSTMAN_COLLECTION:
-            with path.open("r", encoding="utf-8") as f:
-                postman_data = json.load(f)
+        handler = _POSTMAN_HANDLERS.get(suffix)
+        if handler is None:
+            raise FileLoaderError(f"Unsupported Postman file extension: {suffix}")
+        postman_data = handler(path)
 
-            # Validate required fields
-            if "info" not in postman_data or "item" not in postman_data:
-                raise FileLoaderError("Postman collection must contain 'info' and 'item' fields.")
+        # Validate required fields
+        if not isinstance(postman_data, dict):
+            raise FileLoaderError("Postman collection JSON must be an object.")
 
-            logger.success(f"✅ Loaded Postman JSON: {file_path}")
-            return postman_data
-        else:
-            raise FileLoaderError(f"Unsupported Postman file extension: {path.suffix}")
+        if not _POSTMAN_REQ.issubset(postman_data):
+            missing = sorted(_POSTMAN_REQ - postman_data.keys())
+            raise FileLoaderError(f"Postman collection is missing required field(s): {missing}")
+
+        logger.success(f"✅ Loaded Postman JSON: {file_path}")
+        return postman_data
 
     except json.JSONDecodeError as e:
         raise FileLoaderError(f"JSON parsing error in Postman file '{file_path}': {e}")
@@ -110,6 +159,63 @@ def load_postman_file(file_path: str) -> Dict[str, Any]:
         raise FileLoaderError(f"Error loading Postman file: {str(e)}")
 
 
+def load_postman_header(file_path: str) -> Dict[str, Any]:
+    """
+    Validates a Postman collection and returns its 'info' block by streaming
+    the file, without materializing the (potentially huge) 'item' tree.
+
+    Parsing stops as soon as both 'info' and 'item' have been seen, so for
+    standard exports (where 'info' comes first) the cost is proportional to
+    the header, not the file size.
+
+    Args:
+        file_path (str): Path to Postman file.
+
+    Returns:
+        Dict[str, Any]: {"info": <collection info object>}
+
+    Raises:
+        FileLoaderError: If the file is missing, malformed, or invalid.
+    """
+    import ijson
+    from ijson.common import ObjectBuilder
+
+    path, suffix = _resolve(file_path, "Postman collection")
+    if suffix not in _POSTMAN_HANDLERS:
+        raise FileLoaderError(f"Unsupported Postman file extension: {suffix}")
+
+    info = None
+    has_item = False
+    builder = None
+    try:
+        with path.open("rb") as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "info" and event in ("end_map", "end_array"):
+                        info, builder = builder.value, None
+                elif prefix == "" and event == "map_key":
+                    has_item = has_item or value == "item"
+                elif prefix == "info":
+                    if event in ("start_map", "start_array"):
+                        builder = ObjectBuilder()
+                        builder.event(event, value)
+                    else:
+                        info = value
+
+                if info is not None and has_item:
+                    break
+    except ijson.JSONError as e:
+        raise FileLoaderError(f"JSON parsing error in Postman file '{file_path}': {e}")
+
+    if info is None or not has_item:
+        missing = [k for k, seen in (("info", info is not None), ("item", has_item)) if not seen]
+        raise FileLoaderError(f"Postman collection is missing required field(s): {missing}")
+
+    logger.debug(f"📄 Streamed Postman header: {file_path}")
+    return {"info": info}
+
+
 def load_postman_environment(file_path: str) -> Dict[str, Any]:
     """
     Loads a Postman environment JSON file.
@@ -123,22 +229,19 @@ def load_postman_environment(file_path: str) -> Dict[str, Any]:
     Raises:
         FileLoaderError: If invalid structure or parse failure.
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileLoaderError(f"Postman environment file not found: {file_path}")
+    path, suffix = _resolve(file_path, "Postman environment")
 
     try:
-        if path.suffix.lower() in FileType.POSTMAN_ENVIRONMENT:
-            with path.open("r", encoding="utf-8") as f:
-                env_data = json.load(f)
+        handler = _POSTMAN_HANDLERS.get(suffix)
+        if handler is None:
+            raise FileLoaderError(f"Unsupported Postman environment file extension: {suffix}")
+        env_data = handler(path)
 
-            if not isinstance(env_data, dict) or "values" not in env_data:
-                raise FileLoaderError("Postman environment JSON must contain a 'values' key.")
+        if not isinstance(env_data, dict) or not _POSTMAN_ENV_REQ.issubset(env_data):
+            raise FileLoaderError("Postman environment JSON must contain a 'values' key.")
 
-            logger.success(f"✅ Loaded Postman Environment: {file_path}")
-            return env_data
-        else:
-            raise FileLoaderError(f"Unsupported Postman environment file extension: {path.suffix}")
+        logger.success(f"✅ Loaded Postman Environment: {file_path}")
+        return env_data
 
     except json.JSONDecodeError as e:
         raise FileLoaderError(f"JSON parsing error in Postman environment: {e}")
@@ -2,7 +2,7 @@
 Structured logger for the Swagger-to-Postman AI Agent.
 
 - Console logging (rich formatting)
-- Rotating file logging
+- Rotating file logging (DEBUG runs only)
 - Custom SUCCESS level (25)
 - Supports ENV override: AGENT_LOG_LEVEL = DEBUG / INFO / SUCCESS / etc.
 """
@@ -13,10 +13,11 @@ from pathlib import Path
 from typing import Optional
 from logging.handlers import RotatingFileHandler
 
+from dotenv import load_dotenv
 from rich.logging import RichHandler
 from rich.console import Console
 
-from backend.utils.constants import LOG_DIR, LogLevel
+from backend.utils.constants import DOTENV_PATH, LOG_DIR, LogLevel
 
 # === Register Custom SUCCESS Log Level ===
 logging.addLevelName(LogLevel.SUCCESS, "SUCCESS")
@@ -32,6 +33,27 @@ def success(self, message, *args, **kwargs):
 logging.Logger.success = success
 
 
+class FastFormatter(logging.Formatter):
+    """
+    Lean file-log formatter: epoch seconds, level initial, logger name, message.
+
+    Skips formatTime/strftime, which dominates the cost of the default Formatter
+    under high-volume debug logging; tracebacks and stack info are still appended
+    when a record carries them.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = f"{record.created:.3f} {record.levelname[0]} {record.name} {record.getMessage()}"
+        if record.exc_info and not record.exc_text:
+            # Cached on the record, as logging.Formatter does, for other handlers
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        if record.stack_info:
+            line += "\n" + self.formatStack(record.stack_info)
+        return line
+
+
 class LoggerFactory:
     """
     Factory for creating Rich + File rotating loggers.
@@ -46,7 +68,8 @@ class LoggerFactory:
 
         Args:
             name (str): Name of the logger instance.
-            log_to_file (Optional[bool]): Enable writing logs to disk.
+            log_to_file (Optional[bool]): Enable writing logs to disk. Only
+                honoured when the effective level is DEBUG.
 
         Returns:
             logging.Logger: Configured logger instance.
@@ -55,7 +78,9 @@ class LoggerFactory:
         if _logger.handlers:
             return _logger
 
-        # Pull ENV-configured log level or default to INFO
+        # Pull ENV-configured log level or default to INFO. The logger is built
+        # before AppConfig (which loads .env lazily), so read .env here as well.
+        load_dotenv(DOTENV_PATH)
         env_level = os.getenv("AGENT_LOG_LEVEL", "INFO").upper()
         log_level = getattr(LogLevel, env_level, LogLevel.INFO)
 
@@ -72,8 +97,8 @@ class LoggerFactory:
         console_handler.setLevel(log_level)
         _logger.addHandler(console_handler)
 
-        # === File Logger ===
-        if log_to_file:
+        # === File Logger (debug runs only) ===
+        if log_to_file and log_level <= LogLevel.DEBUG:
             LOG_DIR.mkdir(parents=True, exist_ok=True)
             file_handler = RotatingFileHandler(
                 filename=Path(LOG_DIR) / "agent_runtime.log",
@@ -81,9 +106,7 @@ class LoggerFactory:
                 backupCount=2
             )
             file_handler.setLevel(LogLevel.DEBUG)
-            file_handler.setFormatter(logging.Formatter(
-                '%(asctime)s — %(levelname)s — %(name)s — %(message)s'
-            ))
+            file_handler.setFormatter(FastFormatter())
             _logger.addHandler(file_handler)
 
         return _logger
@@ -10,7 +10,32 @@ Features:
 - Flattened schema insights for embedding and scenario generation
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, Iterable
+
+
+def _field_info(prop_name: str, prop_schema: Dict[str, Any], f_type: str) -> Dict[str, Any]:
+    """
+    Builds the per-field metadata entry returned by `parse_schema_properties`.
+
+    Args:
+        prop_name (str): Property name
+        prop_schema (Dict): The property's schema object
+        f_type (str): The property's type, already resolved (defaults to 'object')
+
+    Returns:
+        Dict: Field metadata (type, format, enum, description, flags, example, default)
+    """
+    return {
+        "name": prop_name,
+        "type": f_type,
+        "format": prop_schema.get("format"),
+        "enum": prop_schema.get("enum", []),
+        "description": prop_schema.get("description", ""),
+        "is_boolean": f_type == "boolean",
+        "is_enum": "enum" in prop_schema,
+        "example": prop_schema.get("example"),
+        "default": prop_schema.get("default")
+    }
 
 
 def parse_schema_properties(
@@ -27,29 +52,7 @@ def parse_schema_properties(
     Returns:
         Tuple[List[Dict], List[Dict]]: Required and optional fields with metadata
     """
-    required_fields = required_fields or []
-    required_props, optional_props = [], []
-
-    properties = schema.get("properties", {})
-    for prop_name, prop_schema in properties.items():
-        field_info = {
-            "name": prop_name,
-            "type": prop_schema.get("type", "object"),
-            "format": prop_schema.get("format"),
-            "enum": prop_schema.get("enum", []),
-            "description": prop_schema.get("description", ""),
-            "is_boolean": prop_schema.get("type") == "boolean",
-            "is_enum": "enum" in prop_schema,
-            "example": prop_schema.get("example"),
-            "default": prop_schema.get("default")
-        }
-
-        if prop_name in required_fields:
-            required_props.append(field_info)
-        else:
-            optional_props.append(field_info)
-
-    return required_props, optional_props
+    return analyze_schema(schema, required_fields or ())[0]
 
 
 def flatten_schema_to_summary(schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -62,30 +65,63 @@ def flatten_schema_to_summary(schema: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict: Summary of types, booleans, enums, required/optional lists
     """
-    parsed = {
-        "required_fields": [],
-        "optional_fields": [],
-        "types": {},
-        "booleans": [],
-        "enums": {}
-    }
+    return analyze_schema(schema, with_properties=False)[1]
 
-    required = schema.get("required", [])
-    properties = schema.get("properties", {})
 
-    for field_name, field_schema in properties.items():
+def analyze_schema(
+    schema: Dict[str, Any],
+    required_fields: Optional[Iterable[str]] = None,
+    with_properties: bool = True
+) -> Tuple[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    Computes both the per-field metadata of `parse_schema_properties` and the
+    summary of `flatten_schema_to_summary` in a single pass over 'properties'.
+
+    Args:
+        schema (Dict): OpenAPI schema definition
+        required_fields (Iterable[str], optional): Required field names;
+            defaults to the schema's own 'required' list
+        with_properties (bool): Build the per-field metadata lists as well
+
+    Returns:
+        Tuple: ((required_props, optional_props), summary)
+    """
+    if required_fields is None:
+        required_fields = schema.get("required", ())
+    required = frozenset(required_fields)
+
+    required_props, optional_props = [], []
+    required_names, optional_names, booleans = [], [], []
+    types, enums = {}, {}
+
+    for field_name, field_schema in schema.get("properties", {}).items():
         f_type = field_schema.get("type", "object")
-        parsed["types"][field_name] = f_type
+        types[field_name] = f_type
+        is_required = field_name in required
 
-        if field_name in required:
-            parsed["required_fields"].append(field_name)
+        if is_required:
+            required_names.append(field_name)
         else:
-            parsed["optional_fields"].append(field_name)
+            optional_names.append(field_name)
 
         if f_type == "boolean":
-            parsed["booleans"].append(field_name)
+            booleans.append(field_name)
 
         if "enum" in field_schema:
-            parsed["enums"][field_name] = field_schema["enum"]
-
-    return parsed
+            enums[field_name] = field_schema["enum"]
+
+        if with_properties:
+            field_info = _field_info(field_name, field_schema, f_type)
+            if is_required:
+                required_props.append(field_info)
+            else:
+                optional_props.append(field_info)
+
+    summary = {
+        "required_fields": required_names,
+        "optional_fields": optional_names,
+        "types": types,
+        "booleans": booleans,
+        "enums": enums
+    }
+    return (required_props, optional_props), summary
@@ -5,18 +5,49 @@ Utility class that accepts Swagger/OpenAPI files in either JSON or YAML,
 and converts them to a unified YAML string format for consistent downstream usage.
 
 Usage:
-    SwaggerFormatNormalizer.to_yaml_str(file_path: str) -> str
+    parse_json(path: Path) -> dict
+    parse_yaml(path: Path) -> dict
+    SwaggerFormatNormalizer.to_dict(file_path: str) -> dict
+    SwaggerFormatNormalizer.to_yaml_str(file_path: str, normalize: bool = False) -> str
 """
 
-import json
-import yaml
 from pathlib import Path
 from typing import Union, Dict, Any
 
-from backend.utils.constants import FileType
+from backend.utils.constants import JSON_SUFFIXES, YAML_SUFFIXES
 from backend.utils.logger import logger
 
 
+def parse_json(path: Path) -> Dict[str, Any]:
+    """
+    Parses a JSON file with orjson. Shared by every JSON loader in the package.
+    """
+    import orjson
+
+    return orjson.loads(path.read_bytes())
+
+
+def parse_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Parses a YAML file with the libyaml-backed safe loader when available.
+    Shared by every Swagger YAML loader in the package.
+
+    Raises:
+        yaml.YAMLError: If parsing fails.
+    """
+    import yaml
+    from backend.utils.yaml_compat import YAML_LOADER
+
+    return yaml.load(path.read_bytes(), Loader=YAML_LOADER)
+
+
+# Suffix -> parser dispatch (Path.suffix only ever holds the last extension)
+_PARSERS = {
+    **dict.fromkeys(JSON_SUFFIXES, parse_json),
+    **dict.fromkeys(YAML_SUFFIXES, parse_yaml),
+}
+
+
 class SwaggerFormatNormalizer:
     """
     Converts Swagger input (JSON or YAML) to a normalized YAML string.
@@ -25,37 +56,67 @@ class SwaggerFormatNormalizer:
     """
 
     @staticmethod
-    def to_yaml_str(file_path: Union[str, Path]) -> str:
+    def to_dict(file_path: Union[str, Path]) -> Dict[str, Any]:
         """
-        Converts a Swagger file (.json or .yaml/.yml) into a unified YAML string.
+        Parses a Swagger file (.json or .yaml/.yml) straight into a dict.
+        JSON input never goes through YAML.
 
         Args:
             file_path (str | Path): Path to the Swagger file.
 
         Returns:
-            str: YAML-formatted Swagger content as string.
+            Dict[str, Any]: Parsed Swagger content.
 
         Raises:
             FileNotFoundError: If file is not found.
-            ValueError: If unsupported extension or parsing fails.
+            RuntimeError: If unsupported extension or parsing fails.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Swagger file not found: {file_path}")
-
         ext = path.suffix.lower()
         try:
-            with path.open("r", encoding="utf-8") as f:
-                if ext == FileType.JSON:
-                    json_data: Dict[str, Any] = json.load(f)
-                    logger.debug(f"🔄 Converted JSON Swagger to YAML for: {file_path}")
-                    return yaml.safe_dump(json_data, sort_keys=False)
-                elif ext in FileType.YAML:
-                    content = yaml.safe_load(f)
-                    logger.debug(f"✅ Loaded YAML Swagger directly: {file_path}")
-                    return yaml.safe_dump(content, sort_keys=False)
-                else:
-                    raise ValueError(f"Unsupported file format: {ext}")
+            parser = _PARSERS.get(ext)
+            if parser is None:
+                raise ValueError(f"Unsupported file format: {ext}")
+            # The read itself reports a missing file; no separate exists() stat
+            return parser(path)
 
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Swagger file not found: {file_path}")
         except Exception as e:
-            raise RuntimeError(f"Failed to convert Swagger file '{file_path}' to YAML: {e}")
+            raise RuntimeError(f"Failed to parse Swagger file '{file_path}': {e}")
+
+    @staticmethod
+    def to_yaml_str(file_path: Union[str, Path], normalize: bool = False) -> str:
+        """
+        Converts a Swagger file (.json or .yaml/.yml) into a unified YAML string.
+
+        YAML input is returned verbatim unless `normalize` is set, which avoids a
+        parse + dump round-trip whose only effect is reformatting. Callers that
+        need structured data should use `to_dict` instead.
+
+        Args:
+            file_path (str | Path): Path to the Swagger file.
+            normalize (bool): Re-emit YAML input through the dumper as well.
+
+        Returns:
+            str: YAML-formatted Swagger content as string.
+
+        Raises:
+            FileNotFoundError: If file is not found.
+            RuntimeError: If unsupported extension or parsing fails.
+        """
+        path = Path(file_path)
+        if not normalize and _PARSERS.get(path.suffix.lower()) is parse_yaml:
+            try:
+                return path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Swagger file not found: {file_path}")
+            except OSError as e:
+                raise RuntimeError(f"Failed to read Swagger file '{file_path}': {e}")
+
+        import yaml
+        from backend.utils.yaml_compat import YAML_DUMPER
+
+        content = SwaggerFormatNormalizer.to_dict(path)
+        logger.debug(f"🔄 Normalized Swagger to YAML for: {file_path}")
+        return yaml.dump(content, Dumper=YAML_DUMPER, sort_keys=False)
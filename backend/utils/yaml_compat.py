@@ -0,0 +1,70 @@
+"""
+YAML Compatibility Helpers
+
+Resolves PyYAML's libyaml-backed C loader/dumper once, so every call site
+parses and emits YAML with the fastest available implementation while
+keeping safe_load / safe_dump semantics.
+
+Also provides a process-wide parse cache for YAML files that are read
+repeatedly (config, prompt templates), keyed on (path, mtime, size).
+
+Usage:
+    yaml.load(stream, Loader=YAML_LOADER)
+    yaml.dump(data, Dumper=YAML_DUMPER, sort_keys=False)
+    load_yaml_cached(path) -> read-only parsed content
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Union
+
+import yaml
+
+from backend.utils.logger import logger
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+if YAML_LOADER is yaml.SafeLoader:
+    logger.warning("⚠️ PyYAML was built without libyaml; using the slower pure-Python YAML loader.")
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively wraps dicts in MappingProxyType and turns lists into tuples,
+    so cached results can be shared without callers mutating each other's view.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size are part of the cache key only: an edited file misses.
+    # Bytes go straight to the parser, which detects the encoding (UTF-8/16 BOM).
+    return _freeze(yaml.load(Path(path_str).read_bytes(), Loader=YAML_LOADER))
+
+
+def load_yaml_cached(path: Union[str, Path]) -> Any:
+    """
+    Parses a YAML file at most once per process for each (path, mtime, size).
+
+    Args:
+        path (str | Path): YAML file to load.
+
+    Returns:
+        Any: Deeply read-only parsed content (mappings are MappingProxyType,
+        sequences are tuples).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If parsing fails.
+    """
+    resolved = Path(path).resolve()
+    stat = os.stat(resolved)
+    return _parse_yaml_cached(str(resolved), stat.st_mtime_ns, stat.st_size)